@@ -11,15 +11,21 @@ controls:
     right mousebutton fills with background color
     arrow keys change field size
     spacebar to pause auto colouring
+    , or . shifts pattern along the line, r reverses pattern; both recolour without tracing the line again
     
 usage:
     game = ReflectionPattern(...)
     game.execute()
+
+    python main.py session.jsonl      # records input, replay.py feeds it back and reports latencies
 """
 
 __author__ = 'sukhmel'
 
 import sys
+import json
+import bisect
+import time
 import pygame
 import colorsys
 
@@ -34,6 +40,7 @@ class ReflectionPattern:
     EVENT_RESCALE = pygame.USEREVENT + 3
     EVENT_SET_FPS = pygame.USEREVENT + 4
     EVENT_REBASE = pygame.USEREVENT + 5
+    EVENT_REPATTERN = pygame.USEREVENT + 6
 
     def __init__(self
                  , base             = (21,19)
@@ -47,6 +54,8 @@ class ReflectionPattern:
                  , start_step       = 0
                  , profile          = False
                  , profile_string   = None
+                 , record           = None
+                 , replay           = None
     ):
         """
         initialize internals and reset everything to defaults or passed values
@@ -61,7 +70,11 @@ class ReflectionPattern:
         :param start_direction: initial direction
         :param start_step:      initial index inside of pattern
         :param profile:         close after first complete calculation of the field. Useful for profiling advance()
-        :param profile_string:  executed as "self.[profile_string]" to automatically profile interaction
+        :param profile_string:  executed as is, e.g. "self.flood((0, 0), (255, 0, 0))", to automatically profile interaction
+        :param record:          file name to write handled input events to, see replay.py
+        :param replay:          list of (frame, event) to be handled instead of real input. Latency of every event
+                                till the next shown frame is collected in self.latencies, without waiting between
+                                frames
         """
         self.paint_auto_steps = paint_auto_steps
         self.profile_string = profile_string
@@ -84,6 +97,7 @@ class ReflectionPattern:
         self.direction  = 0
         self.position   = 0
         self.patt_step  = 0
+        self.step_count = 0
 
         self.palette    = [(0, 0, 0)]
         self.auto_palette = []
@@ -114,9 +128,29 @@ class ReflectionPattern:
         self.proceed = True
         self.draw    = True
 
-        self.uncoloured = set() # uncoloured points
-        self.buffer     = set()
-        self.data = [] # [ [1(\),0( ),-1(/)], line color, top color, bottom color, is rendered flag
+        self.coloured      = bytearray() # 1 for every auto-coloured part of cell, see point_index()
+        self.coloured_next = 0           # parts before this index are already handled by auto colouring
+        self.auto_paused   = False
+        self.data = [] # [ [1(\),0( ),-1(/)], top color, bottom color, is rendered flag, visit step ]
+        self.segments = [] # [start cell, direction, length, step of advance() at start] for each bounce-to-bounce run
+
+        self.frame     = 0
+        self.replay    = replay
+        self.pending   = []   # (label, start time) of replayed events whose effect is not shown yet
+        self.latencies = {}   # label: [seconds, ...]
+        self.record    = None
+        if record is not None:
+            self.record = open(record, 'w')
+            self.record.write(json.dumps({'params': {
+                'base'             : self.base,
+                'scale'            : self.scale,
+                'pattern'          : self.pattern,
+                'auto_color'       : self.auto_color,
+                'paint_auto_steps' : self.paint_auto_steps,
+                'fps'              : self.fps,
+                'start_position'   : self.in_position,
+                'start_direction'  : self.in_direction,
+                'start_step'       : self.in_step}}) + '\n')
 
         self.size = (1, 1)
         self.reset(force=True)
@@ -129,31 +163,28 @@ class ReflectionPattern:
             field = pygame.Surface(pygame.display.get_surface().get_size()).convert()
             field.fill(self.get_color(self.back_color))
             pygame.display.get_surface().blit(field, (0, 0))
-            pygame.display.flip()
+            self.flip(shown=False)
 
         elif base is not None:
             self.base = base
             # clear all drawing data that relies on field size
             # list comprehension is used to correctly fill an array with copies, not references
             self.data = [[[0, # line type: 0 - no line, 1 is \, -1 is /
-                           self.get_color(self.fore_color), # line color
                            self.get_color(self.back_color), # upper color
                            self.get_color(self.back_color), # lower color
-                           False]                           # is rendered
+                           False,                           # is rendered
+                           None]                            # step of advance() that visited the cell
                           for y in range(self.base[1])]
                          for x in range(self.base[0])]
 
-            # information for auto-colouring
-            self.uncoloured = set()
-            for x in range(self.base[0]):
-                for y in range(self.base[1]):
-                    for z in (2, 3):
-                        self.uncoloured.add((x, y, z))
+            self.reset_uncoloured()
+            self.segments = []
 
             # all input values are reset to defaults
             self.direction = list(self.in_direction)
             self.position = self.in_position
             self.patt_step = self.in_step
+            self.step_count = 0
 
             # pattern generation is restarted
             self.proceed = True
@@ -171,12 +202,61 @@ class ReflectionPattern:
 
                 rows = (self.color_shown and [1] or [self.color_picker_rows])[0]
                 self.resize(size=(self.size[0], self.size[1] + self.color_picker_height * rows))
-                self.paint_color_picker(picker = not self.color_shown)
+                self.paint_color_picker(picker = not self.color_shown, shown = False)
+
+    def reset_uncoloured(self):
+        """
+        mark every part of every cell as not yet auto-coloured
+        """
+        self.coloured = bytearray(2 * self.base[0] * self.base[1])
+        self.coloured_next = 0
+
+    def point_index(self, point):
+        """
+        :param point: (x, y, top)
+        :return:      index of point in self.coloured
+        """
+        return (point[0] * self.base[1] + point[1]) * 2 + point[2] - 1
+
+    def repattern(self, pattern = None, start_step = None):
+        """
+        change pattern or its initial index without tracing the line again.
+        Path of the line depends only on field size, start position and direction, so it is enough
+        to recolour cells of every segment by the step at which they were visited. All fills are cleared
+        :param pattern:    new pattern, current one if None
+        :param start_step: new initial index inside of pattern, current one if None
+        """
+        if pattern is not None:
+            self.pattern = pattern
+        if start_step is not None:
+            self.in_step = start_step
+
+        length = len(self.pattern)
+        colors = [self.line_color(step) for step in range(length)]
+        back = self.get_color(self.back_color)
+        for column in self.data:
+            for cell in column:
+                cell[1] = back
+                cell[2] = back
+                cell[3] = False
+
+        # slope of the line is kept only once for a whole segment
+        for start, direction, count, step in self.segments:
+            slope = direction[0]*direction[1]
+            for i in range(count):
+                cell = self.data[start[0] + direction[0]*i][start[1] + direction[1]*i]
+                cell[0] = (colors[(step + i) % length] is not None and [slope] or [0])[0]
+
+        # line that is still being traced continues with the new pattern
+        self.patt_step = (self.step_count + self.in_step) % length
+
+        self.reset_uncoloured()
+        self.draw = True
 
     def reset(self, new_base = None, force = False):
         """
         reset field parameters, restart calculating if necessary, otherwise continue
-        set all data[4] to False, so that they are rendered
+        whole field is repainted at once on next frame
         :param new_base: size of field without respect to scaling
         """
         if self.base != new_base or force:
@@ -186,9 +266,7 @@ class ReflectionPattern:
                 self.reset(self.base, force=force)
 
         else:   # only redraw is necessary
-            for y in range(self.base[1]):
-                for x in range(self.base[0]):
-                    self.data[x][y][4] = False
+            self.draw = True
 
         self.resize()
         #self.repaint()
@@ -230,7 +308,17 @@ class ReflectionPattern:
             queue.append(pygame.event.Event(self.EVENT_RESCALE, {'scale': scale}))
 
         if event.key == pygame.K_SPACE:
-            self.uncoloured, self.buffer = self.buffer, self.uncoloured
+            self.auto_paused = not self.auto_paused
+
+        repattern = None
+        if event.unicode == ",":
+            repattern = {'start_step': (self.in_step - delta) % len(self.pattern)}
+        if event.unicode == ".":
+            repattern = {'start_step': (self.in_step + delta) % len(self.pattern)}
+        if event.unicode == "r":
+            repattern = {'pattern': self.pattern[::-1]}
+        if repattern is not None:
+            queue.append(pygame.event.Event(self.EVENT_REPATTERN, repattern))
 
         fps = None
         if event.unicode == "<":
@@ -254,10 +342,11 @@ class ReflectionPattern:
                 (event.type == pygame.KEYDOWN and event.key in [pygame.K_ESCAPE, pygame.K_q]):
                 actions += [pygame.event.Event(self.EVENT_EXIT, {})]
 
-            if event.type is pygame.KEYDOWN:
+            if event.type == pygame.KEYDOWN:
                 actions += self.key_press(event)
 
-            if event.type is pygame.KEYUP and sum(pygame.key.get_pressed()) == 0:
+            # replayed key releases carry keyboard state recorded with them, see record_events()
+            if event.type == pygame.KEYUP and not getattr(event, 'held', sum(pygame.key.get_pressed()) > 0):
                 actions += [pygame.event.Event(self.EVENT_RESIZE, {})]
 
             if  event.type == pygame.MOUSEBUTTONUP:
@@ -273,22 +362,33 @@ class ReflectionPattern:
         start main loop for events and rendering
         """
         while 1:
-            actions = self.user_input(pygame.event.get())
+            events = pygame.event.get()
+            if self.replay is not None:
+                events += self.replay_events()
+            if self.record is not None:
+                self.record_events(events)
+            actions = self.user_input(events)
 
             for event in actions:
-                if event.type is self.EVENT_RESIZE:
+                if event.type == self.EVENT_RESIZE:
                     self.resize(self.new_base)
                     self.new_base = None
-                if event.type is self.EVENT_EXIT:
+                if event.type == self.EVENT_EXIT:
+                    if self.record is not None:
+                        self.record.close()
                     sys.exit(0)
-                if event.type is self.EVENT_SET_FPS:
+                if event.type == self.EVENT_SET_FPS:
                     self.fps = event.fps
-                if event.type is self.EVENT_RESCALE:
+                if event.type == self.EVENT_RESCALE:
                     self.scale = event.scale
                     self.reset()
-                if event.type is self.EVENT_REBASE:
+                if event.type == self.EVENT_REBASE:
                     self.new_base = event.base
                     self.set_caption()
+                if event.type == self.EVENT_REPATTERN:
+                    self.repattern(getattr(event, 'pattern', None), getattr(event, 'start_step', None))
+                if event.type == self.EVENT_EXEC:
+                    exec(event.do)
 
             if self.proceed:
                 pos = self.advance()
@@ -300,10 +400,75 @@ class ReflectionPattern:
                     self.paint()
                     self.draw = False
 
-                if not (self.auto_color and self.automatic_colouring(self.paint_auto_steps)):
+                # replay counts frames, not time, so there is no need to wait
+                if not (self.auto_color and self.automatic_colouring(self.paint_auto_steps)) and self.replay is None:
                     pygame.time.wait(100)
 
-            pygame.time.Clock().tick(self.fps)
+            if self.replay is None:
+                pygame.time.Clock().tick(self.fps)
+            self.frame += 1
+
+    def flip(self, shown = True):
+        """
+        show painted frame and stop measuring latency of events handled before it
+        :param shown: False if field itself is not painted yet, e.g. screen is only cleared after resize
+        """
+        pygame.display.flip()
+        if shown:
+            now = time.perf_counter()
+            for label, start in self.pending:
+                self.latencies.setdefault(label, []).append(now - start)
+            self.pending = []
+
+    def record_events(self, events):
+        """
+        write input events handled by user_input() to the record file along with current frame
+        :param events: events of current frame
+        """
+        for event in events:
+            if event.type in (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONUP, self.EVENT_EXEC):
+                attributes = dict((k, v) for k, v in event.dict.items()
+                                  if k in ('key', 'unicode', 'mod', 'button', 'pos', 'do'))
+                if event.type == pygame.KEYUP:
+                    # resize waits for all keys to be released, replay can not ask the keyboard for that
+                    attributes['held'] = sum(pygame.key.get_pressed()) > 0
+                self.record.write(json.dumps({'frame': self.frame,
+                                              'type' : event.type,
+                                              'dict' : attributes}) + '\n')
+        self.record.flush()
+
+    def replay_events(self):
+        """
+        take events scheduled for current frame from self.replay and start measuring their latency.
+        Quit is posted when everything is replayed and field is completely traced and painted.
+        Events left in self.pending then have not caused any frame
+        :return: list of events to handle
+        """
+        events = []
+        # checked before taking new events, so that the last of them has its effect shown
+        if not self.replay and not self.proceed and not self.draw:
+            events.append(pygame.event.Event(pygame.QUIT, {}))
+
+        while self.replay and self.replay[0][0] <= self.frame:
+            event = self.replay.pop(0)[1]
+            if event.type == pygame.KEYDOWN:
+                pygame.key.set_mods(getattr(event, 'mod', 0))
+            if event.type != pygame.QUIT:
+                label = pygame.event.event_name(event.type)
+                if hasattr(event, 'key'):
+                    label += ' ' + pygame.key.name(event.key)
+                if hasattr(event, 'button'):
+                    label += ' %i' % event.button
+                self.pending.append((label, time.perf_counter()))
+            events.append(event)
+        return events
+
+    def line_color(self, step):
+        """
+        :param step: step of advance() that visited a cell
+        :return:     color of line in that cell, None if there is a gap
+        """
+        return self.get_color(self.pattern[(step + self.in_step) % len(self.pattern)])
 
     def get_color(self, index, palette = None):
         """
@@ -348,11 +513,20 @@ class ReflectionPattern:
         else:
             value = self.direction[0]*self.direction[1]
 
-        # field data:      at given coordinates, [1(\)0( )-1(/)], line,  top,           bottom, already rendered
-        self.data[self.position[0]][self.position[1]] = [value, color,
+        # field data:      at given coordinates, [1(\)0( )-1(/)], top,           bottom, already rendered,
+        #                  visit step
+        self.data[self.position[0]][self.position[1]] = [value,
                                                          self.get_color(self.back_color),
-                                                         self.get_color(self.back_color), False]
+                                                         self.get_color(self.back_color), False,
+                                                         self.step_count]
+        direction = tuple(self.direction)
+        if self.segments and self.segments[-1][1] == direction:
+            self.segments[-1][2] += 1
+        else:
+            self.segments.append([tuple(self.position), direction, 1, self.step_count])
+
         self.patt_step = (self.patt_step + 1) % len(self.pattern)
+        self.step_count += 1
 
         new_position = list(self.position)
         for i in range(2):
@@ -383,39 +557,105 @@ class ReflectionPattern:
         """
         field = None
         draw  = True
-        if force:   #dedicated cycle to improve performance
-            for x in range(len(self.data)):
-                for y in range(len(self.data[x])):
-                    self.data[x][y][4] = False
+        segments = set()
+        if force:   # field is cleared at once, so only cells with fills are painted one by one
+            field = pygame.display.get_surface()
+            back = self.get_color(self.back_color)
+            field.fill(back, pygame.Rect((0, 0), self.size))
+            segments = None
+        else:       # segment of a cell is found by the step it was visited at
+            starts = [segment[3] for segment in self.segments]
         for x in range(len(self.data)):
-            for y in range(len(self.data[x])):
-                field = self.paint((x, y), False, field)
+            column = self.data[x]
+            for y in range(len(column)):
+                if force:
+                    column[y][3] = column[y][1] == back and column[y][2] == back
+                if not column[y][3]:
+                    # line is drawn by segments later, because fills of a cell cover it
+                    if segments is not None and column[y][4] is not None:
+                        segments.add(bisect.bisect_right(starts, column[y][4]) - 1)
+                    field = self.paint((x, y), False, field, line=False)
         if field is not None:
+            if segments is not None:
+                segments = sorted(segments)
+            self.paint_segments(field, segments)
             pygame.display.get_surface().blit(field, (0,0))
-            pygame.display.flip()
+            self.flip()
         else:
             draw = False
         return draw
 
+    def paint_segments(self, field, indices = None):
+        """
+        paint line layer: one line per run of cells of same color inside of a segment, instead of one per cell
+        :param field:   screen to paint
+        :param indices: indices of segments to paint, all segments if None
+        """
+        if indices is None:
+            indices = range(len(self.segments))
+
+        # pattern is periodic, so run of same color starting at every phase of it is found once
+        length = len(self.pattern)
+        colors = [self.line_color(step) for step in range(length)]
+        runs = []
+        for phase in range(length):
+            run = 1
+            while run < length and colors[(phase + run) % length] == colors[phase]:
+                run += 1
+            runs.append((colors[phase], (run < length and [run] or [sys.maxsize])[0]))
+
+        scale = self.scale
+        for index in indices:
+            start, direction, count, step = self.segments[index]
+            # left and right ends of the line inside of a cell depend on slope, see paint()
+            slope = direction[0]*direction[1]
+            i = 0
+            while i < count:
+                color, run = runs[(step + i) % length]
+                run = min(run, count - i)
+                if color is not None:
+                    first = (start[0] + direction[0]*i, start[1] + direction[1]*i)
+                    last  = (start[0] + direction[0]*(i + run - 1), start[1] + direction[1]*(i + run - 1))
+                    left, right = sorted((first, last))
+                    # diagonals of square cells make one straight line, otherwise they make a staircase
+                    cells = (scale[0] == scale[1] and [(0, run - 1)] or [range(run)])[0]
+                    points = []
+                    for k in cells:
+                        if slope == 1:
+                            x, y = left[0] + k, left[1] + k
+                            points += [(x*scale[0], y*scale[1]),
+                                       (x*scale[0] + scale[0] - 1, y*scale[1] + scale[1] - 1)]
+                        else:
+                            x, y = right[0] - k, right[1] + k
+                            points += [(x*scale[0] + scale[0] - 1, y*scale[1]),
+                                       (x*scale[0], y*scale[1] + scale[1] - 1)]
+                    if scale[0] == scale[1]:
+                        points = [points[0], points[-1]]
+                    pygame.draw.lines(field, color, False, points)
+                i += run
+
     def automatic_colouring(self, repaint = False):
-        result = True
-        try:
-            point = self.uncoloured.pop()
-        except KeyError:
-            result = False
-        else:
-            self.flood(point=point, auto=True)
+        result = False
+        if not self.auto_paused:
+            index = self.coloured.find(0, self.coloured_next)
+            if index != -1:
+                result = True
+                # point is handled even if flood does not colour it
+                self.coloured_next = index + 1
+                cell, top = divmod(index, 2)
+                self.flood(point=divmod(cell, self.base[1]) + (top + 1, ), auto=True)
 
         if repaint or not result:
             self.repaint()
 
         return result
 
-    def paint_color_picker(self, picker = True, palette = None):
+    def paint_color_picker(self, picker = True, palette = None, shown = True):
         """
         paint color chooser or current click color
         :param picker:  true if chooser should be shown
         :param palette: color palette to draw, self.palette by default
+        :param shown:   false if field is not painted yet, see flip()
         :return: true if color is displayed, false if picker is displayed
         """
         if palette is None:
@@ -467,22 +707,23 @@ class ReflectionPattern:
         pygame.display.get_surface().blit(screen, (0, 0))
         pygame.display.get_surface().blit(pick_box, (0, self.size[1]))
 
-        pygame.display.flip()
+        self.flip(shown)
         return not picker
 
-    def paint(self, pos = None, flip = True, field = None):
+    def paint(self, pos = None, flip = True, field = None, line = True):
         """
         paint one part of field
-        :param pos:   data coordinates
+        :param pos:   data coordinates, whole field is repainted if None
         :param flip:  display field after painting
         :param field: screen to paint or None for current screen
+        :param line:  paint line too, otherwise only fills are painted
         :return:      modified screen used for painting
         """
         if pos is None:
-            self.repaint()
+            self.repaint(force=True)
 
         else:
-            if self.data[pos[0]][pos[1]] is not None and not self.data[pos[0]][pos[1]][4]:
+            if self.data[pos[0]][pos[1]] is not None and not self.data[pos[0]][pos[1]][3]:
                 if field is None:
                     field = pygame.display.get_surface()
                 value = self.data[pos[0]][pos[1]][0]
@@ -515,20 +756,23 @@ class ReflectionPattern:
                     upper_points[1] = corners[0]
                     lower_points[1] = corners[3]
 
-                pygame.draw.polygon(field, self.data[pos[0]][pos[1]][2], upper_points)
-                pygame.draw.polygon(field, self.data[pos[0]][pos[1]][3], lower_points)
+                if self.data[pos[0]][pos[1]][1] == self.data[pos[0]][pos[1]][2]:
+                    field.fill(self.data[pos[0]][pos[1]][1], pygame.Rect(corners[0], self.scale))
+                else:
+                    pygame.draw.polygon(field, self.data[pos[0]][pos[1]][1], upper_points)
+                    pygame.draw.polygon(field, self.data[pos[0]][pos[1]][2], lower_points)
 
-                if self.data[pos[0]][pos[1]][0] != 0:
-                    pygame.draw.line(field, self.data[pos[0]][pos[1]][1], points[0], points[1])
+                if line and self.data[pos[0]][pos[1]][0] != 0:
+                    pygame.draw.line(field, self.line_color(self.data[pos[0]][pos[1]][4]), points[0], points[1])
 
-                self.data[pos[0]][pos[1]][4] = True
+                self.data[pos[0]][pos[1]][3] = True
 
                 if flip:
                     pygame.display.get_surface().blit(field, corners[0],
                                                       pygame.Rect(corners[0],
                                                           (corners[3][0] - corners[0][0],
                                                            corners[3][1] - corners[0][1])))
-                    pygame.display.flip()
+                    self.flip()
 
         return field
 
@@ -572,24 +816,24 @@ class ReflectionPattern:
 
         # we go to bottom of upper cell if we are on top, or to top of lower cell otherwise
         if direction is 'v':
-            delta = (pos[2] == 2 and [-1] or [+1])[0]
+            delta = (pos[2] == 1 and [-1] or [+1])[0]
             result[1] += delta
-            result[2]  = int((5 - delta)/2)
+            result[2]  = int((3 - delta)/2)
 
         # if top and bottom are connected, we go to other part of same cell
         if direction is 's':
             if self.data[pos[0]][pos[1]][0] == 0:
-                result[2] = 5 - pos[2]
+                result[2] = 3 - pos[2]
             else:
                 raise IndexError
 
         # we go to different directions depending on current line state
         if direction is 'h':
             value = (self.data[pos[0]][pos[1]][0] == -1 and [-1] or [1])[0]
-            step = (pos[2] == 2 and [value] or [-value])[0]
+            step = (pos[2] == 1 and [value] or [-value])[0]
             adj_value = (self.data[pos[0] + step][pos[1]][0] == -1 and [-1] or [1])[0]
             result[0] += step
-            result[2] = (adj_value == step and [3] or [2])[0]
+            result[2] = (adj_value == step and [2] or [1])[0]
 
         # check for boundaries. Will throw IndexError if not correct
         if -1 < result[0] < self.base[0] and -1 < result[1] < self.base[1]:
@@ -613,8 +857,8 @@ class ReflectionPattern:
         if point is None:
             place = (int(pos[0]/self.scale[0]) % self.size[0], int(pos[1]/self.scale[1]) % self.size[1])
             value = (self.data[place[0]][place[1]][0] == -1 and [-1] or [1])[0]
-            # top's value is index of corresponding color in data; 2 is top, 3 is bottom
-            top = ((0 < pos[0] % self.scale[0] - value*(pos[1] % self.scale[1]) < sum(self.scale)/2) and [2] or [3])[0]
+            # top's value is index of corresponding color in data; 1 is top, 2 is bottom
+            top = ((0 < pos[0] % self.scale[0] - value*(pos[1] % self.scale[1]) < sum(self.scale)/2) and [1] or [2])[0]
             point = tuple(place) + (top, )
 
         screen = pygame.display.get_surface()
@@ -628,7 +872,7 @@ class ReflectionPattern:
                 color = self.get_color(int(len(area)/2), self.auto_palette)
             for position in area:
                 self.data[position[0]][position[1]][position[2]] = color
-                self.data[position[0]][position[1]][4] = False
+                self.data[position[0]][position[1]][3] = False
 
         return screen
 
@@ -652,7 +896,8 @@ class ReflectionPattern:
                         except IndexError:
                             pass
         if mark_as_coloured:
-            self.uncoloured = self.uncoloured - result
+            for point in result:
+                self.coloured[self.point_index(point)] = 1
 
         return result
 
@@ -671,7 +916,8 @@ class ReflectionPattern:
             + ', color is (%i, %i, %i) ' %  self.get_color(self.click_color) + '#%i' % self.click_color)
 
 if __name__ == "__main__":
-    game = ReflectionPattern(auto_color=True, base=(81, 79), scale=6, fps=0, paint_auto_steps=True)
+    game = ReflectionPattern(auto_color=True, base=(81, 79), scale=6, fps=0, paint_auto_steps=True,
+                             record=(len(sys.argv) > 1 and [sys.argv[1]] or [None])[0])
     game.execute()
 # 123 119
 # 19  21
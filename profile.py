@@ -29,6 +29,14 @@ starts = (
         , 'pattern'        : [1, 0]
     }, # flood speed test
 
+    {
+        'profile' : True
+        , 'profile_string' : "self.repattern((True, None, True), 1)"
+        , 'base'           : (816, 499)
+        , 'scale'          : (2, 2)
+        , 'pattern'        : [1, 0]
+    }, # recolouring without retracing
+
     {
         'profile' : True
         , 'base'             : (816, 499)
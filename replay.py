@@ -0,0 +1,79 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+usage:
+    python main.py session.jsonl      # play and record input
+    python replay.py session.jsonl    # feed recorded input back and report latencies
+"""
+
+__author__ = 'sukhmel'
+
+import os
+import sys
+import json
+import math
+
+# must be set before pygame is initialized by main
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+import pygame
+from main import ReflectionPattern
+
+
+def load(name):
+    """
+    read record written by ReflectionPattern(record=name)
+    :param name: file name
+    :return:     (constructor parameters, list of (frame, event))
+    """
+    params = {}
+    events = []
+    with open(name) as record:
+        for line in record:
+            entry = json.loads(line)
+            if 'params' in entry:
+                params = entry['params']
+            else:
+                attributes = entry['dict']
+                if 'pos' in attributes:
+                    attributes['pos'] = tuple(attributes['pos'])
+                events.append((entry['frame'], pygame.event.Event(entry['type'], attributes)))
+    return params, events
+
+
+def percentile(values, part):
+    """
+    nearest-rank percentile
+    :param values: sorted list
+    :param part:   percentile in range 0..100
+    """
+    return values[max(0, math.ceil(part / 100 * len(values)) - 1)]
+
+
+if __name__ == "__main__":
+    params, events = load(sys.argv[1])
+    for key in ('base', 'scale', 'start_position', 'start_direction'):
+        if key in params:
+            params[key] = tuple(params[key])
+
+    game = ReflectionPattern(replay=events, **params)
+    try:
+        game.execute()
+    except SystemExit:
+        pass
+
+    print('%-24s %6s %10s %10s %10s %10s' % ('event', 'count', 'p50, ms', 'p90, ms', 'p99, ms', 'max, ms'))
+    for label in sorted(game.latencies):
+        values = sorted(game.latencies[label])
+        print('%-24s %6i %10.2f %10.2f %10.2f %10.2f' % (label, len(values),
+                                                         percentile(values, 50) * 1000,
+                                                         percentile(values, 90) * 1000,
+                                                         percentile(values, 99) * 1000,
+                                                         values[-1] * 1000))
+
+    # events with no visible effect are not given latency of zero, they are only counted
+    unshown = {}
+    for label, start in game.pending:
+        unshown[label] = unshown.get(label, 0) + 1
+    for label in sorted(unshown):
+        print('%-24s %6i %10s' % (label, unshown[label], 'no frame'))